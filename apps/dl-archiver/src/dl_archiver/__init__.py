@@ -1,5 +1,8 @@
+from collections.abc import Iterable
+
 import sqlalchemy as sa
 from core import CloudManager, Database
+from sqlalchemy.orm import Session
 
 from .config import Config
 from .models import FileModel
@@ -7,16 +10,28 @@ from .models import FileModel
 config = Config()
 db = Database(config.database_url, config.readonly_database_url)
 
+_OLD_PATH = sa.bindparam("old_path", type_=sa.String())
+_NEW_PATH = sa.bindparam("new_path", type_=sa.String())
+_UPDATE_PATH = (
+    sa.update(FileModel).where(FileModel.path == _OLD_PATH).values(path=_NEW_PATH)
+)
+
+
+def update_paths(session: Session, renames: Iterable[tuple[str, str]]) -> None:
+    """
+    Rename file records in a single executemany round trip.
+    Args:
+        session: The session to execute the update in.
+        renames: (old_path, new_path) pairs to apply.
+    """
+    params = [{"old_path": old, "new_path": new} for old, new in renames]
+    if not params:
+        return
+    session.connection().execute(_UPDATE_PATH, params)
+
 
 def main() -> None:
-    with open("test.txt", "w") as f:
-        f.write("Hello, world!")
     cm = CloudManager(config.cloud_provider, config.provider_config)
-    cm.upload_object("test.txt", "test-bucket", "test.txt")
+    cm.put_bytes(b"Hello, world!", "test-bucket", "test.txt")
     with db.session() as session:
-        update_stmt = (
-            sa.update(FileModel)
-            .where(FileModel.path == "test.txt")
-            .values(path="new_path.txt")
-        )
-        session.execute(update_stmt)
+        update_paths(session, [("test.txt", "new_path.txt")])
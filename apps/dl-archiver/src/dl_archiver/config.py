@@ -1,7 +1,10 @@
 import os
+from functools import cached_property
 
 from core import CloudProvider, ProviderConfig
 
+_PROVIDER_BY_NAME = {p.value: p for p in CloudProvider}
+
 
 class Config:
     def __init__(self) -> None:
@@ -14,19 +17,18 @@ class Config:
         self.database_url = os.getenv("DATABASE_URL", "sqlite:///:memory:")
         self.readonly_database_url = os.getenv("READONLY_DATABASE_URL")
 
-    @property
+    @cached_property
     def cloud_provider(self) -> CloudProvider:
         if not self._provider_name:
             raise ValueError("CLOUD_PROVIDER environment variable is not set")
-        try:
-            return CloudProvider(self._provider_name.lower())
-        except ValueError as err:
-            valid_providers = [p.value for p in CloudProvider]
+        provider = _PROVIDER_BY_NAME.get(self._provider_name.lower())
+        if provider is None:
             raise ValueError(
-                f"Invalid cloud provider: {self._provider_name}. Valid providers: {valid_providers}"
-            ) from err
+                f"Invalid cloud provider: {self._provider_name}. Valid providers: {list(_PROVIDER_BY_NAME)}"
+            )
+        return provider
 
-    @property
+    @cached_property
     def provider_config(self) -> ProviderConfig:
         return ProviderConfig(
             aws_region_name=self.aws_region_name,
@@ -1,13 +1,15 @@
-import sqlalchemy as sa
+from datetime import datetime
 
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-class Base(sa.orm.DeclarativeBase):
+
+class Base(DeclarativeBase):
     pass
 
 
 class FileModel(Base):
     __tablename__ = "files"
-    id = sa.Column(sa.Integer, primary_key=True)
-    path = sa.Column(sa.String, nullable=False)
-    created_at = sa.Column(sa.DateTime, nullable=False)
-    updated_at = sa.Column(sa.DateTime, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    path: Mapped[str] = mapped_column(index=True)
+    created_at: Mapped[datetime]
+    updated_at: Mapped[datetime]
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from dl_archiver import update_paths
+from dl_archiver.models import Base, FileModel
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+def test_update_paths_runs_a_single_executemany() -> None:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime.now()
+    with Session(engine) as session, session.begin():
+        session.add_all(
+            FileModel(path=path, created_at=now, updated_at=now)
+            for path in ("a", "b", "c")
+        )
+    executions: list[bool] = []
+
+    def record(
+        conn: Connection,
+        cursor: object,
+        statement: str,
+        parameters: object,
+        context: object,
+        executemany: bool,
+    ) -> None:
+        executions.append(executemany)
+
+    sa.event.listen(engine, "before_cursor_execute", record)
+    with Session(engine) as session, session.begin():
+        update_paths(session, [("a", "x"), ("b", "y")])
+        update_paths(session, [])
+    sa.event.remove(engine, "before_cursor_execute", record)
+
+    assert executions == [True]
+    with Session(engine) as session:
+        paths = session.scalars(sa.select(FileModel.path).order_by(FileModel.path))
+        assert list(paths) == ["c", "x", "y"]
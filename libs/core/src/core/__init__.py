@@ -1,15 +1,51 @@
-from .cloud_manager import (
-    AWSConfig,
-    CloudManager,
-    CloudProvider,
-    ProviderConfig,
-)
-from .database import Database
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_cloud_manager import AsyncAWSCloudManager
+    from .cloud_manager import (
+        AWSConfig,
+        CloudManager,
+        CloudProvider,
+        ProviderConfig,
+    )
+    from .database import Database
 
 __all__ = [
+    "AsyncAWSCloudManager",
     "AWSConfig",
     "CloudManager",
     "CloudProvider",
     "Database",
     "ProviderConfig",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # Resolve exports lazily so importing one submodule's dependencies
+    # (boto3, aioboto3, SQLAlchemy) doesn't pay for the others.
+    match name:
+        case "AsyncAWSCloudManager":
+            from .async_cloud_manager import AsyncAWSCloudManager
+
+            return AsyncAWSCloudManager
+        case "AWSConfig":
+            from .cloud_manager import AWSConfig
+
+            return AWSConfig
+        case "CloudManager":
+            from .cloud_manager import CloudManager
+
+            return CloudManager
+        case "CloudProvider":
+            from .cloud_manager import CloudProvider
+
+            return CloudProvider
+        case "ProviderConfig":
+            from .cloud_manager import ProviderConfig
+
+            return ProviderConfig
+        case "Database":
+            from .database import Database
+
+            return Database
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
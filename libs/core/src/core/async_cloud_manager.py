@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import Iterable
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Self
+
+import aioboto3
+from aiobotocore.config import AioConfig
+
+from .cloud_manager import AWSConfig, _AWSSettings
+
+if TYPE_CHECKING:
+    from types_aiobotocore_s3.client import S3Client
+
+
+class AsyncAWSCloudManager(_AWSSettings):
+    """
+    Asynchronous AWS implementation of the cloud manager.
+    Runs S3 transfers on the event loop so many objects can be in flight at once.
+    A single client is opened on first use and shared by every call, and at most
+    max_concurrency transfers run at a time, so single-object calls can be fanned
+    out with asyncio.gather. Use the manager as an async context manager, or call
+    close(), to release the client. A manager is bound to the event loop it is
+    first used on.
+    """
+
+    def __init__(self, config: AWSConfig):
+        super().__init__(config)
+        self._session = aioboto3.Session(profile_name=self.profile_name)
+        self._client: S3Client | None = None
+        self._client_stack = AsyncExitStack()
+        self._client_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def __aenter__(self) -> Self:
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the shared client. The next transfer opens a new one.
+        """
+        async with self._client_lock:
+            self._client = None
+            await self._client_stack.aclose()
+
+    async def _get_client(self) -> "S3Client":
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await self._client_stack.enter_async_context(
+                    self._session.client(
+                        "s3",
+                        region_name=self.region_name,
+                        config=AioConfig(**self._client_options()),
+                    )
+                )
+            return self._client
+
+    async def upload_object(
+        self, file_path: str, bucket_name: str, object_key: str
+    ) -> None:
+        """
+        Upload a file to S3.
+        Args:
+            file_path: The path to the file to upload.
+            bucket_name: The name of the bucket to upload the object to.
+            object_key: The key of the object to upload.
+        """
+        client = await self._get_client()
+        async with self._semaphore:
+            await client.upload_file(
+                file_path, bucket_name, object_key, Config=self._transfer_config
+            )
+
+    async def download_object(
+        self, bucket_name: str, object_key: str, file_path: str
+    ) -> None:
+        """
+        Download an object from S3.
+        Args:
+            bucket_name: The name of the bucket to download the object from.
+            object_key: The key of the object to download.
+            file_path: The path of the local file to download the object to.
+        """
+        client = await self._get_client()
+        async with self._semaphore:
+            await client.download_file(
+                bucket_name, object_key, file_path, Config=self._transfer_config
+            )
+
+    async def upload_objects(self, uploads: Iterable[tuple[str, str, str]]) -> None:
+        """
+        Upload many files to S3 concurrently. If an upload fails, the others are
+        cancelled and the failures are raised together as an ExceptionGroup.
+        Args:
+            uploads: (file_path, bucket_name, object_key) tuples to upload.
+        """
+        async with asyncio.TaskGroup() as group:
+            for file_path, bucket_name, object_key in uploads:
+                group.create_task(
+                    self.upload_object(file_path, bucket_name, object_key)
+                )
+
+    async def download_objects(self, downloads: Iterable[tuple[str, str, str]]) -> None:
+        """
+        Download many objects from S3 concurrently. If a download fails, the
+        others are cancelled and the failures are raised together as an
+        ExceptionGroup.
+        Args:
+            downloads: (bucket_name, object_key, file_path) tuples to download.
+        """
+        async with asyncio.TaskGroup() as group:
+            for bucket_name, object_key, file_path in downloads:
+                group.create_task(
+                    self.download_object(bucket_name, object_key, file_path)
+                )
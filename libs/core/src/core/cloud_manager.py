@@ -1,10 +1,63 @@
+import os
+import queue
+import sys
+import threading
+import urllib.parse
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from enum import Enum
-from typing import NotRequired, TypedDict
-
-import boto3
-from mypy_boto3_s3.client import S3Client
+from functools import cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, NotRequired, TypedDict
+
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from boto3.session import Session
+    from botocore.config import Config as BotoConfig
+    from botocore.config import _RetryDict
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import (
+        CompletedPartTypeDef,
+        CreateMultipartUploadRequestTypeDef,
+        HeadObjectOutputTypeDef,
+        ListObjectsV2OutputTypeDef,
+    )
+
+    from .async_cloud_manager import AsyncAWSCloudManager
+
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_BULK_WORKERS = 32
+DEFAULT_COPY_MULTIPART_THRESHOLD = 100 * 1024 * 1024
+COPY_PART_SIZE = 64 * 1024 * 1024
+MAX_MULTIPART_PARTS = 10_000
+LIST_PREFETCH_PAGES = 4
+DELETE_BATCH_SIZE = 1000
+
+# boto3 sessions are expensive to create but not thread-safe, so they are
+# cached per profile and region and clients are created under a lock.
+_SESSION_LOCK = threading.Lock()
+_SESSIONS: dict[tuple[str | None, str], "Session"] = {}
+
+
+def _part_size(size: int, min_part_size: int) -> int:
+    """Smallest part size of at least min_part_size that fits S3's part limit."""
+    return max(min_part_size, (size + MAX_MULTIPART_PARTS - 1) // MAX_MULTIPART_PARTS)
+
+
+def _create_client(
+    profile_name: str | None, region_name: str, config: "BotoConfig"
+) -> "S3Client":
+    import boto3
+
+    with _SESSION_LOCK:
+        session = _SESSIONS.get((profile_name, region_name))
+        if session is None:
+            session = boto3.Session(profile_name=profile_name, region_name=region_name)
+            _SESSIONS[(profile_name, region_name)] = session
+        return session.client("s3", region_name=region_name, config=config)
 
 
 class AWSConfig(TypedDict, total=False):
@@ -15,11 +68,21 @@ class AWSConfig(TypedDict, total=False):
     aws_secret_key_id: NotRequired[str | None]
     aws_session_token: NotRequired[str | None]
     aws_profile_name: NotRequired[str | None]
+    multipart_threshold: NotRequired[int]
+    multipart_chunksize: NotRequired[int]
+    max_concurrency: NotRequired[int]
+    copy_multipart_threshold: NotRequired[int]
 
 
 ProviderConfig = AWSConfig
 
 
+class _ClientOptions(TypedDict):
+    max_pool_connections: int
+    retries: "_RetryDict"
+    tcp_keepalive: bool
+
+
 class CloudProvider(Enum):
     """Supported cloud providers"""
 
@@ -46,6 +109,17 @@ class AbstractCloudManager(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def put_bytes(self, data: bytes, bucket_name: str, object_key: str) -> None:
+        """
+        Upload in-memory data to cloud storage without going through a local file.
+        Args:
+            data: The bytes to upload.
+            bucket_name: The name of the bucket to upload the object to.
+            object_key: The key of the object to upload.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def download_object(
         self, bucket_name: str, object_key: str, file_path: str
@@ -66,6 +140,7 @@ class AbstractCloudManager(ABC):
         object_key: str,
         dest_object_key: str,
         delete_source: bool = True,
+        size: int | None = None,
     ) -> None:
         """
         Move an object within the same bucket.
@@ -74,6 +149,8 @@ class AbstractCloudManager(ABC):
             object_key: The key of the object to move.
             dest_object_key: The key of the object to move the object to.
             delete_source: Whether to delete the source object after moving.
+            size: The size of the object in bytes, if the caller already knows it.
+                Skips the HEAD request for objects below the copy threshold.
         """
         raise NotImplementedError()
 
@@ -85,6 +162,7 @@ class AbstractCloudManager(ABC):
         dest_bucket_name: str,
         dest_object_key: str,
         delete_source: bool = True,
+        size: int | None = None,
     ) -> None:
         """
         Transfer an object to a new bucket.
@@ -94,6 +172,8 @@ class AbstractCloudManager(ABC):
             dest_bucket_name: The name of the bucket to transfer the object to.
             dest_object_key: The key of the object to transfer the object to.
             delete_source: Whether to delete the source object after transferring.
+            size: The size of the object in bytes, if the caller already knows it.
+                Skips the HEAD request for objects below the copy threshold.
         """
         raise NotImplementedError()
 
@@ -107,6 +187,20 @@ class AbstractCloudManager(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def bulk_delete(
+        self, bucket_name: str, object_keys: Iterable[str]
+    ) -> dict[str, str]:
+        """
+        Delete many objects from cloud storage in batched requests.
+        Args:
+            bucket_name: The name of the bucket to delete the objects from.
+            object_keys: The keys of the objects to delete.
+        Returns:
+            A mapping of object keys that failed to delete to their error messages.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def list_dir(self, bucket_name: str, prefix: str) -> Iterator[str]:
         """
@@ -117,11 +211,31 @@ class AbstractCloudManager(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def bulk_download(
+        self,
+        bucket_name: str,
+        prefix: str,
+        dest_dir: str,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> dict[str, Exception]:
+        """
+        Download every object under a prefix concurrently.
+        Args:
+            bucket_name: The name of the bucket to download the objects from.
+            prefix: The prefix of the objects to download.
+            dest_dir: The local directory to download the objects to.
+            max_workers: The maximum number of concurrent downloads.
+        Returns:
+            A mapping of object keys that failed to download to their errors.
+        """
+        raise NotImplementedError()
+
 
-class AWSCloudManager(AbstractCloudManager):
+class _AWSSettings:
     """
-    AWS implementation of the cloud manager.
-    Provides unified access to AWS S3
+    Region, credentials and transfer tuning shared by the sync and async AWS
+    managers, so both read an AWSConfig the same way.
     """
 
     def __init__(self, config: AWSConfig):
@@ -130,22 +244,167 @@ class AWSCloudManager(AbstractCloudManager):
         self.access_key_id = config.get("aws_access_key_id")
         self.secret_key_id = config.get("aws_secret_key_id")
         self.session_token = config.get("aws_session_token")
-        self._s3_client: S3Client | None = None
+        self.multipart_threshold = config.get(
+            "multipart_threshold", DEFAULT_MULTIPART_THRESHOLD
+        )
+        self.multipart_chunksize = config.get(
+            "multipart_chunksize", DEFAULT_MULTIPART_CHUNKSIZE
+        )
+        self.max_concurrency = config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        self.copy_multipart_threshold = config.get(
+            "copy_multipart_threshold", DEFAULT_COPY_MULTIPART_THRESHOLD
+        )
+
+    # boto3 is imported on first use so importing core stays cheap for callers
+    # that never touch S3.
+    @cached_property
+    def _transfer_config(self) -> "TransferConfig":
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunksize=self.multipart_chunksize,
+            max_concurrency=self.max_concurrency,
+            use_threads=True,
+        )
+
+    @cached_property
+    def _serial_transfer_config(self) -> "TransferConfig":
+        """
+        Used where the caller already parallelizes across objects, so each
+        transfer doesn't spawn its own pool of part threads.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunksize=self.multipart_chunksize,
+            use_threads=False,
+        )
+
+    def _client_options(self) -> "_ClientOptions":
+        """
+        Options for the botocore or aiobotocore client config. The connection
+        pool is sized so concurrent transfers don't queue for a connection.
+        """
+        return {
+            "max_pool_connections": max(DEFAULT_BULK_WORKERS, self.max_concurrency * 2),
+            "retries": {"mode": "adaptive", "max_attempts": 10},
+            "tcp_keepalive": True,
+        }
+
+
+class AWSCloudManager(_AWSSettings, AbstractCloudManager):
+    """
+    AWS implementation of the cloud manager.
+    Provides unified access to AWS S3
+    """
 
-    @property
-    def s3_client(self) -> S3Client:
-        if not self._s3_client:
-            session = boto3.Session(profile_name=self.profile_name)
-            self._s3_client = session.client("s3", region_name=self.region_name)
-        return self._s3_client
+    @cached_property
+    def s3_client(self) -> "S3Client":
+        from botocore.config import Config as BotoConfig
+
+        return _create_client(
+            self.profile_name, self.region_name, BotoConfig(**self._client_options())
+        )
 
     def upload_object(self, file_path: str, bucket_name: str, object_key: str) -> None:
-        self.s3_client.upload_file(file_path, bucket_name, object_key)
+        if os.path.getsize(file_path) > self.multipart_threshold:
+            self.upload_object_crt(file_path, bucket_name, object_key)
+            return
+        self.s3_client.upload_file(
+            file_path, bucket_name, object_key, Config=self._transfer_config
+        )
+
+    def upload_object_crt(
+        self, file_path: str, bucket_name: str, object_key: str
+    ) -> None:
+        """
+        Upload a file through the AWS CRT transfer manager.
+        Falls back to the classic transfer manager when the CRT client cannot
+        serve the request (e.g. a region or credentials mismatch).
+        Args:
+            file_path: The path to the file to upload.
+            bucket_name: The name of the bucket to upload the object to.
+            object_key: The key of the object to upload.
+        """
+        from boto3.crt import create_crt_transfer_manager
+
+        manager = create_crt_transfer_manager(self.s3_client, self._transfer_config)
+        if manager is None:
+            self.s3_client.upload_file(
+                file_path, bucket_name, object_key, Config=self._transfer_config
+            )
+            return
+        with manager:
+            manager.upload(file_path, bucket_name, object_key).result()
+
+    def upload_object_pread(
+        self, file_path: str, bucket_name: str, object_key: str
+    ) -> None:
+        """
+        Multipart upload that reads each part with a positional os.pread from the
+        worker thread uploading it, so disk reads overlap with in-flight parts.
+        Falls back to upload_object on Windows and for files below the
+        multipart threshold.
+        Args:
+            file_path: The path to the file to upload.
+            bucket_name: The name of the bucket to upload the object to.
+            object_key: The key of the object to upload.
+        """
+        size = os.path.getsize(file_path)
+        if sys.platform == "win32" or size <= self.multipart_threshold:
+            self.upload_object(file_path, bucket_name, object_key)
+            return
+
+        part_size = _part_size(size, self.multipart_chunksize)
+        # Open the file before starting the upload so a missing or unreadable
+        # file can't leave an orphaned multipart upload behind.
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            upload_id = self.s3_client.create_multipart_upload(
+                Bucket=bucket_name, Key=object_key
+            )["UploadId"]
+
+            def upload_part(part_number: int, start: int) -> "CompletedPartTypeDef":
+                response = self.s3_client.upload_part(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=os.pread(fd, part_size, start),
+                )
+                return {"ETag": response["ETag"], "PartNumber": part_number}
+
+            starts = range(0, size, part_size)
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                    parts = list(
+                        executor.map(upload_part, range(1, len(starts) + 1), starts)
+                    )
+                self.s3_client.complete_multipart_upload(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            except Exception:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=bucket_name, Key=object_key, UploadId=upload_id
+                )
+                raise
+        finally:
+            os.close(fd)
+
+    def put_bytes(self, data: bytes, bucket_name: str, object_key: str) -> None:
+        self.s3_client.put_object(Bucket=bucket_name, Key=object_key, Body=data)
 
     def download_object(
         self, bucket_name: str, object_key: str, file_path: str
     ) -> None:
-        self.s3_client.download_file(bucket_name, object_key, file_path)
+        self.s3_client.download_file(
+            bucket_name, object_key, file_path, Config=self._transfer_config
+        )
 
     def move_object(
         self,
@@ -153,8 +412,9 @@ class AWSCloudManager(AbstractCloudManager):
         object_key: str,
         dest_object_key: str,
         delete_source: bool = True,
+        size: int | None = None,
     ) -> None:
-        self.upload_object(bucket_name, object_key, dest_object_key)
+        self._copy_object(bucket_name, object_key, bucket_name, dest_object_key, size)
         if delete_source:
             self.delete_object(bucket_name, object_key)
 
@@ -165,22 +425,224 @@ class AWSCloudManager(AbstractCloudManager):
         dest_bucket_name: str,
         dest_object_key: str,
         delete_source: bool = True,
+        size: int | None = None,
     ) -> None:
-        copy_source = f"{bucket_name}/{object_key}"
-        self.s3_client.copy_object(
-            Bucket=dest_bucket_name, Key=dest_object_key, CopySource=copy_source
+        self._copy_object(
+            bucket_name, object_key, dest_bucket_name, dest_object_key, size
         )
         if delete_source:
             self.delete_object(bucket_name, object_key)
 
+    def _copy_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        dest_bucket_name: str,
+        dest_object_key: str,
+        size: int | None = None,
+    ) -> None:
+        """
+        Server-side copy of an object. Objects above copy_multipart_threshold
+        are split into parallel UploadPartCopy requests.
+        """
+        if size is None or size > self.copy_multipart_threshold:
+            head = self.s3_client.head_object(Bucket=bucket_name, Key=object_key)
+            if head["ContentLength"] > self.copy_multipart_threshold:
+                self._multipart_copy(
+                    head, bucket_name, object_key, dest_bucket_name, dest_object_key
+                )
+                return
+        self.s3_client.copy_object(
+            Bucket=dest_bucket_name,
+            Key=dest_object_key,
+            CopySource={"Bucket": bucket_name, "Key": object_key},
+        )
+
+    def _multipart_copy(
+        self,
+        head: "HeadObjectOutputTypeDef",
+        bucket_name: str,
+        object_key: str,
+        dest_bucket_name: str,
+        dest_object_key: str,
+    ) -> None:
+        """
+        Copy an object as parallel UploadPartCopy requests, each pinned to the
+        ETag the source had when it was looked up.
+        """
+        size = head["ContentLength"]
+        upload_id = self.s3_client.create_multipart_upload(
+            **self._copy_upload_params(
+                head, bucket_name, object_key, dest_bucket_name, dest_object_key
+            )
+        )["UploadId"]
+        part_size = _part_size(size, COPY_PART_SIZE)
+
+        def copy_part(part_number: int, start: int) -> "CompletedPartTypeDef":
+            end = min(start + part_size, size) - 1
+            response = self.s3_client.upload_part_copy(
+                Bucket=dest_bucket_name,
+                Key=dest_object_key,
+                CopySource={"Bucket": bucket_name, "Key": object_key},
+                CopySourceIfMatch=head["ETag"],
+                CopySourceRange=f"bytes={start}-{end}",
+                PartNumber=part_number,
+                UploadId=upload_id,
+            )
+            return {
+                "ETag": response["CopyPartResult"]["ETag"],
+                "PartNumber": part_number,
+            }
+
+        starts = range(0, size, part_size)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                parts = list(executor.map(copy_part, range(1, len(starts) + 1), starts))
+            self.s3_client.complete_multipart_upload(
+                Bucket=dest_bucket_name,
+                Key=dest_object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.s3_client.abort_multipart_upload(
+                Bucket=dest_bucket_name, Key=dest_object_key, UploadId=upload_id
+            )
+            raise
+
+    def _copy_upload_params(
+        self,
+        head: "HeadObjectOutputTypeDef",
+        bucket_name: str,
+        object_key: str,
+        dest_bucket_name: str,
+        dest_object_key: str,
+    ) -> "CreateMultipartUploadRequestTypeDef":
+        """
+        Build create_multipart_upload arguments that carry over the source
+        object's headers, metadata, storage class, encryption and tags, the
+        same as copy_object does with its default COPY directives.
+        """
+        params: CreateMultipartUploadRequestTypeDef = {
+            "Bucket": dest_bucket_name,
+            "Key": dest_object_key,
+            "Metadata": head.get("Metadata", {}),
+        }
+        if content_type := head.get("ContentType"):
+            params["ContentType"] = content_type
+        if content_encoding := head.get("ContentEncoding"):
+            params["ContentEncoding"] = content_encoding
+        if content_disposition := head.get("ContentDisposition"):
+            params["ContentDisposition"] = content_disposition
+        if content_language := head.get("ContentLanguage"):
+            params["ContentLanguage"] = content_language
+        if cache_control := head.get("CacheControl"):
+            params["CacheControl"] = cache_control
+        if storage_class := head.get("StorageClass"):
+            params["StorageClass"] = storage_class
+        if server_side_encryption := head.get("ServerSideEncryption"):
+            params["ServerSideEncryption"] = server_side_encryption
+        if sse_kms_key_id := head.get("SSEKMSKeyId"):
+            params["SSEKMSKeyId"] = sse_kms_key_id
+        tag_set = self.s3_client.get_object_tagging(Bucket=bucket_name, Key=object_key)[
+            "TagSet"
+        ]
+        if tag_set:
+            params["Tagging"] = urllib.parse.urlencode(
+                [(tag["Key"], tag["Value"]) for tag in tag_set],
+                quote_via=urllib.parse.quote,
+            )
+        return params
+
     def delete_object(self, bucket_name: str, object_key: str) -> None:
         self.s3_client.delete_object(Bucket=bucket_name, Key=object_key)
 
+    def bulk_delete(
+        self, bucket_name: str, object_keys: Iterable[str]
+    ) -> dict[str, str]:
+        errors: dict[str, str] = {}
+        keys = iter(object_keys)
+        while batch := list(islice(keys, DELETE_BATCH_SIZE)):
+            response = self.s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                errors[error.get("Key", "")] = (
+                    f"{error.get('Code', '')}: {error.get('Message', '')}"
+                )
+        return errors
+
     def list_dir(self, bucket_name: str, prefix: str) -> Iterator[str]:
+        # Fetch the next pages on a background thread while the caller
+        # processes the current one.
         paginator = self.s3_client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
-            for obj in page.get("Contents", []):
-                yield obj["Key"]
+        pages: queue.Queue[ListObjectsV2OutputTypeDef | Exception | None] = queue.Queue(
+            maxsize=LIST_PREFETCH_PAGES
+        )
+        stop = threading.Event()
+
+        def produce() -> None:
+            try:
+                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                    if stop.is_set():
+                        return
+                    pages.put(page)
+            except Exception as err:
+                pages.put(err)
+                return
+            pages.put(None)
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while (page := pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                for obj in page.get("Contents", []):
+                    yield obj["Key"]
+        finally:
+            # Unblock a producer waiting on a full queue if the caller stopped early.
+            stop.set()
+            while not pages.empty():
+                pages.get_nowait()
+
+    def bulk_download(
+        self,
+        bucket_name: str,
+        prefix: str,
+        dest_dir: str,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> dict[str, Exception]:
+        errors: dict[str, Exception] = {}
+        root = os.path.realpath(dest_dir)
+
+        def download(object_key: str, file_path: str) -> None:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self.s3_client.download_file(
+                bucket_name,
+                object_key,
+                file_path,
+                Config=self._serial_transfer_config,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict[Future[None], str] = {}
+            for object_key in self.list_dir(bucket_name, prefix):
+                if object_key.endswith("/"):
+                    continue
+                file_path = os.path.realpath(os.path.join(root, object_key))
+                if file_path == root or os.path.commonpath([root, file_path]) != root:
+                    errors[object_key] = ValueError(
+                        f"Object key {object_key!r} resolves outside {dest_dir!r}"
+                    )
+                    continue
+                futures[executor.submit(download, object_key, file_path)] = object_key
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as err:
+                    errors[futures[future]] = err
+        return errors
 
 
 class CloudManager(AbstractCloudManager):
@@ -192,23 +654,28 @@ class CloudManager(AbstractCloudManager):
     def __init__(self, provider: CloudProvider, config: ProviderConfig):
         self._provider = provider
         self._config = config
-        self._manager: AbstractCloudManager | None = None
+        match provider:
+            case CloudProvider.AWS:
+                self._manager: AbstractCloudManager = AWSCloudManager(config)
 
-    @property
-    def manager(self) -> AbstractCloudManager:
-        if not self._manager:
-            match self._provider:
-                case CloudProvider.AWS:
-                    self._manager = AWSCloudManager(self._config)
-        return self._manager
+    @cached_property
+    def async_manager(self) -> "AsyncAWSCloudManager":
+        from .async_cloud_manager import AsyncAWSCloudManager
+
+        match self._provider:
+            case CloudProvider.AWS:
+                return AsyncAWSCloudManager(self._config)
 
     def upload_object(self, file_path: str, bucket_name: str, object_key: str) -> None:
-        self.manager.upload_object(file_path, bucket_name, object_key)
+        self._manager.upload_object(file_path, bucket_name, object_key)
+
+    def put_bytes(self, data: bytes, bucket_name: str, object_key: str) -> None:
+        self._manager.put_bytes(data, bucket_name, object_key)
 
     def download_object(
         self, bucket_name: str, object_key: str, file_path: str
     ) -> None:
-        self.manager.download_object(bucket_name, object_key, file_path)
+        self._manager.download_object(bucket_name, object_key, file_path)
 
     def move_object(
         self,
@@ -216,9 +683,10 @@ class CloudManager(AbstractCloudManager):
         object_key: str,
         dest_object_key: str,
         delete_source: bool = True,
+        size: int | None = None,
     ) -> None:
-        return self.manager.move_object(
-            bucket_name, object_key, dest_object_key, delete_source
+        return self._manager.move_object(
+            bucket_name, object_key, dest_object_key, delete_source, size
         )
 
     def transfer_object(
@@ -228,13 +696,33 @@ class CloudManager(AbstractCloudManager):
         dest_bucket_name: str,
         dest_object_key: str,
         delete_source: bool = True,
+        size: int | None = None,
     ) -> None:
-        return self.manager.transfer_object(
-            bucket_name, object_key, dest_bucket_name, dest_object_key, delete_source
+        return self._manager.transfer_object(
+            bucket_name,
+            object_key,
+            dest_bucket_name,
+            dest_object_key,
+            delete_source,
+            size,
         )
 
     def delete_object(self, bucket_name: str, object_key: str) -> None:
-        return self.manager.delete_object(bucket_name, object_key)
+        return self._manager.delete_object(bucket_name, object_key)
+
+    def bulk_delete(
+        self, bucket_name: str, object_keys: Iterable[str]
+    ) -> dict[str, str]:
+        return self._manager.bulk_delete(bucket_name, object_keys)
 
     def list_dir(self, bucket_name: str, prefix: str) -> Iterator[str]:
-        return self.manager.list_dir(bucket_name, prefix)
+        return self._manager.list_dir(bucket_name, prefix)
+
+    def bulk_download(
+        self,
+        bucket_name: str,
+        prefix: str,
+        dest_dir: str,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> dict[str, Exception]:
+        return self._manager.bulk_download(bucket_name, prefix, dest_dir, max_workers)
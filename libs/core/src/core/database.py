@@ -1,24 +1,64 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
+QUERY_CACHE_SIZE = 1200
+POOL_RECYCLE_SECONDS = 1800
+
 
 class ConnectionNotConfigured(Exception):
     """Raised when attempting to use a session but a connection is not configured."""
 
 
+def _create_engine(url: str, pool_size: int, max_overflow: int) -> Engine:
+    """
+    Create an engine with a pre-pinged, periodically recycled connection pool.
+    In-memory SQLite uses a SingletonThreadPool, which does not accept pool sizing.
+    """
+    parsed_url = make_url(url)
+    if parsed_url.get_backend_name() == "sqlite" and parsed_url.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return create_engine(
+            parsed_url,
+            echo=False,
+            query_cache_size=QUERY_CACHE_SIZE,
+            pool_pre_ping=True,
+            pool_recycle=POOL_RECYCLE_SECONDS,
+        )
+    return create_engine(
+        parsed_url,
+        echo=False,
+        query_cache_size=QUERY_CACHE_SIZE,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+    )
+
+
 class Database:
     """
     Database class that provides readonly and write sessions with autocommit.
     Can be instantiated and used globally in applications.
     """
 
-    def __init__(self, write_url: str, readonly_url: str | None = None) -> None:
-        self._db: Engine = create_engine(write_url, echo=False)
+    def __init__(
+        self,
+        write_url: str,
+        readonly_url: str | None = None,
+        pool_size: int = 20,
+        max_overflow: int = 40,
+    ) -> None:
+        self._db: Engine = _create_engine(write_url, pool_size, max_overflow)
         self._db_ro: Engine | None = (
-            create_engine(readonly_url, echo=False) if readonly_url else None
+            _create_engine(readonly_url, pool_size, max_overflow)
+            if readonly_url
+            else None
         )
         self._session = sessionmaker(bind=self._db, autocommit=False, autoflush=False)
         self._session_ro = (
@@ -37,11 +77,5 @@ class Database:
             raise ConnectionNotConfigured(
                 "Readonly connection not configured. Provide readonly_url when initializing the database."
             )
-        try:
+        with _session, _session.begin():
             yield _session
-            _session.commit()
-        except Exception:
-            _session.rollback()
-            raise
-        finally:
-            _session.close()
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from core.async_cloud_manager import AsyncAWSCloudManager
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.closed = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled: list[str] = []
+
+    async def __aenter__(self) -> "FakeClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.closed = True
+
+    async def _transfer(self, object_key: str) -> None:
+        assert not self.closed
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if object_key == "bad":
+                raise RuntimeError("transfer failed")
+            await asyncio.sleep(0.01 if object_key != "slow" else 10)
+        except asyncio.CancelledError:
+            self.cancelled.append(object_key)
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def upload_file(
+        self, file_path: str, bucket_name: str, object_key: str, Config: object
+    ) -> None:
+        await self._transfer(object_key)
+
+    async def download_file(
+        self, bucket_name: str, object_key: str, file_path: str, Config: object
+    ) -> None:
+        await self._transfer(object_key)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.clients: list[FakeClient] = []
+
+    def client(self, service_name: str, **kwargs: object) -> FakeClient:
+        client = FakeClient()
+        self.clients.append(client)
+        return client
+
+
+def make_manager(session: FakeSession) -> AsyncAWSCloudManager:
+    manager = AsyncAWSCloudManager({"max_concurrency": 2})
+    manager._session = session  # type: ignore[assignment]
+    return manager
+
+
+def test_single_object_calls_share_one_client_and_concurrency_limit() -> None:
+    session = FakeSession()
+
+    async def run() -> None:
+        async with make_manager(session) as manager:
+            await asyncio.gather(
+                *(
+                    manager.upload_object(f"/tmp/{n}", "bucket", f"k{n}")
+                    for n in range(6)
+                )
+            )
+
+    asyncio.run(run())
+
+    assert len(session.clients) == 1
+    assert session.clients[0].max_in_flight == 2
+    assert session.clients[0].closed
+
+
+def test_download_objects_cancels_siblings_before_client_closes() -> None:
+    session = FakeSession()
+
+    async def run() -> None:
+        async with make_manager(session) as manager:
+            with pytest.raises(ExceptionGroup) as excinfo:
+                await manager.download_objects(
+                    [("bucket", "slow", "/tmp/slow"), ("bucket", "bad", "/tmp/bad")]
+                )
+            assert excinfo.group_contains(RuntimeError, match="transfer failed")
+            assert not session.clients[0].closed
+
+    asyncio.run(run())
+
+    assert session.clients[0].cancelled == ["slow"]
+    assert session.clients[0].in_flight == 0
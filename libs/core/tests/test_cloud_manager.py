@@ -0,0 +1,339 @@
+import io
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import boto3
+import core.cloud_manager as cloud_manager
+import pytest
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from core.cloud_manager import AWSCloudManager
+
+
+@pytest.fixture
+def manager() -> AWSCloudManager:
+    manager = AWSCloudManager({"max_concurrency": 1})
+    manager.s3_client = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+    return manager
+
+
+@pytest.fixture
+def stubber(manager: AWSCloudManager) -> Iterator[Stubber]:
+    with Stubber(manager.s3_client) as stubber:
+        yield stubber
+
+
+def list_page(keys: list[str], next_token: str | None = None) -> dict[str, object]:
+    page: dict[str, object] = {"Contents": [{"Key": key} for key in keys]}
+    if next_token is not None:
+        page["IsTruncated"] = True
+        page["NextContinuationToken"] = next_token
+    return page
+
+
+def test_list_dir_stops_producer_when_caller_breaks_early(
+    manager: AWSCloudManager, stubber: Stubber
+) -> None:
+    total_pages = 10
+    for n in range(total_pages):
+        token = str(n + 1) if n + 1 < total_pages else None
+        stubber.add_response("list_objects_v2", list_page([f"p/{n}"], token))
+    requests = 0
+
+    def count_request(**kwargs: object) -> None:
+        nonlocal requests
+        requests += 1
+
+    manager.s3_client.meta.events.register(
+        "before-call.s3.ListObjectsV2", count_request
+    )
+    threads_before = threading.active_count()
+
+    for key in manager.list_dir("bucket", "p/"):
+        assert key == "p/0"
+        break
+
+    deadline = time.monotonic() + 5
+    while threading.active_count() > threads_before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert threading.active_count() == threads_before
+    assert requests < total_pages
+
+
+def test_list_dir_reraises_paginator_errors(
+    manager: AWSCloudManager, stubber: Stubber
+) -> None:
+    stubber.add_response("list_objects_v2", list_page(["p/a", "p/b"], "next"))
+    stubber.add_client_error("list_objects_v2", "AccessDenied", "Access Denied")
+
+    keys: list[str] = []
+    with pytest.raises(ClientError, match="AccessDenied"):
+        for key in manager.list_dir("bucket", "p/"):
+            keys.append(key)
+    assert keys == ["p/a", "p/b"]
+
+
+def test_transfer_object_copies_small_objects_with_copy_object(
+    manager: AWSCloudManager, stubber: Stubber
+) -> None:
+    copy_source = {"Bucket": "src", "Key": "a"}
+    stubber.add_response(
+        "head_object", {"ContentLength": 5}, {"Bucket": "src", "Key": "a"}
+    )
+    stubber.add_response(
+        "copy_object", {}, {"Bucket": "dst", "Key": "b", "CopySource": copy_source}
+    )
+    stubber.add_response("delete_object", {}, {"Bucket": "src", "Key": "a"})
+
+    manager.transfer_object("src", "a", "dst", "b")
+
+    stubber.assert_no_pending_responses()
+
+
+def test_move_object_with_known_small_size_skips_head(
+    manager: AWSCloudManager, stubber: Stubber
+) -> None:
+    copy_source = {"Bucket": "src", "Key": "a"}
+    stubber.add_response(
+        "copy_object", {}, {"Bucket": "src", "Key": "b", "CopySource": copy_source}
+    )
+
+    manager.move_object("src", "a", "b", delete_source=False, size=5)
+
+    stubber.assert_no_pending_responses()
+
+
+def test_transfer_object_multipart_copy_covers_last_byte(
+    manager: AWSCloudManager, stubber: Stubber, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager.copy_multipart_threshold = 20
+    monkeypatch.setattr(cloud_manager, "COPY_PART_SIZE", 10)
+    size = 25
+    copy_source = {"Bucket": "src", "Key": "a"}
+    stubber.add_response(
+        "head_object",
+        {
+            "ContentLength": size,
+            "ETag": '"etag"',
+            "ContentType": "text/csv",
+            "Metadata": {"owner": "archiver"},
+        },
+        {"Bucket": "src", "Key": "a"},
+    )
+    stubber.add_response(
+        "get_object_tagging",
+        {"TagSet": [{"Key": "team", "Value": "data eng"}]},
+        {"Bucket": "src", "Key": "a"},
+    )
+    stubber.add_response(
+        "create_multipart_upload",
+        {"UploadId": "upload"},
+        {
+            "Bucket": "dst",
+            "Key": "b",
+            "ContentType": "text/csv",
+            "Metadata": {"owner": "archiver"},
+            "Tagging": "team=data%20eng",
+        },
+    )
+    for part_number, copy_range in enumerate(
+        ["bytes=0-9", "bytes=10-19", f"bytes=20-{size - 1}"], start=1
+    ):
+        stubber.add_response(
+            "upload_part_copy",
+            {"CopyPartResult": {"ETag": f'"{part_number}"'}},
+            {
+                "Bucket": "dst",
+                "Key": "b",
+                "CopySource": copy_source,
+                "CopySourceIfMatch": '"etag"',
+                "CopySourceRange": copy_range,
+                "PartNumber": part_number,
+                "UploadId": "upload",
+            },
+        )
+    stubber.add_response(
+        "complete_multipart_upload",
+        {},
+        {
+            "Bucket": "dst",
+            "Key": "b",
+            "UploadId": "upload",
+            "MultipartUpload": {
+                "Parts": [{"ETag": f'"{n}"', "PartNumber": n} for n in (1, 2, 3)]
+            },
+        },
+    )
+
+    manager.transfer_object("src", "a", "dst", "b", delete_source=False)
+
+    stubber.assert_no_pending_responses()
+
+
+def test_bulk_delete_batches_requests(
+    manager: AWSCloudManager, stubber: Stubber
+) -> None:
+    keys = [f"k{n}" for n in range(2001)]
+    for batch in (keys[:1000], keys[1000:2000], keys[2000:]):
+        stubber.add_response(
+            "delete_objects",
+            {"Errors": [{"Key": "k2000", "Code": "AccessDenied", "Message": "no"}]}
+            if batch == keys[2000:]
+            else {},
+            {
+                "Bucket": "bucket",
+                "Delete": {"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            },
+        )
+
+    errors = manager.bulk_delete("bucket", iter(keys))
+
+    stubber.assert_no_pending_responses()
+    assert errors == {"k2000": "AccessDenied: no"}
+
+
+def test_bulk_delete_merges_errors_across_batches(
+    manager: AWSCloudManager, stubber: Stubber, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cloud_manager, "DELETE_BATCH_SIZE", 2)
+    for batch_errors in (
+        [{"Key": "a", "Code": "AccessDenied", "Message": "no"}],
+        [],
+        [{"Key": "e", "Code": "InternalError", "Message": "retry"}],
+    ):
+        stubber.add_response("delete_objects", {"Errors": batch_errors})
+
+    errors = manager.bulk_delete("bucket", (key for key in "abcde"))
+
+    stubber.assert_no_pending_responses()
+    assert errors == {"a": "AccessDenied: no", "e": "InternalError: retry"}
+
+
+def test_bulk_delete_without_keys_sends_no_request(
+    manager: AWSCloudManager, stubber: Stubber
+) -> None:
+    assert manager.bulk_delete("bucket", []) == {}
+    stubber.assert_no_pending_responses()
+
+
+def test_bulk_download_rejects_keys_outside_dest_dir(
+    manager: AWSCloudManager, stubber: Stubber, tmp_path: Path
+) -> None:
+    keys = ["../escape.txt", "a", "a/b", "dir/", "ok.txt"]
+    stubber.add_response("list_objects_v2", list_page(keys))
+    for key in ("a", "ok.txt"):
+        data = key.encode()
+        stubber.add_response(
+            "head_object",
+            {"ContentLength": len(data)},
+            {"Bucket": "bucket", "Key": key},
+        )
+        stubber.add_response(
+            "get_object",
+            {"Body": StreamingBody(io.BytesIO(data), len(data))},
+        )
+
+    errors = manager.bulk_download("bucket", "", str(tmp_path), max_workers=1)
+
+    stubber.assert_no_pending_responses()
+    assert set(errors) == {"../escape.txt", "a/b"}
+    assert isinstance(errors["../escape.txt"], ValueError)
+    assert isinstance(errors["a/b"], OSError)
+    assert not (tmp_path.parent / "escape.txt").exists()
+    assert (tmp_path / "ok.txt").read_bytes() == b"ok.txt"
+    assert (tmp_path / "a").read_bytes() == b"a"
+
+
+def test_upload_object_pread_uploads_file_in_parts(
+    manager: AWSCloudManager, stubber: Stubber, tmp_path: Path
+) -> None:
+    manager.multipart_threshold = 10
+    manager.multipart_chunksize = 7
+    data = bytes(range(20))
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(data)
+    stubber.add_response(
+        "create_multipart_upload",
+        {"UploadId": "upload"},
+        {"Bucket": "bucket", "Key": "key"},
+    )
+    for part_number, start in enumerate((0, 7, 14), start=1):
+        stubber.add_response(
+            "upload_part",
+            {"ETag": f'"{part_number}"'},
+            {
+                "Bucket": "bucket",
+                "Key": "key",
+                "PartNumber": part_number,
+                "UploadId": "upload",
+                "Body": data[start : start + 7],
+            },
+        )
+    stubber.add_response(
+        "complete_multipart_upload",
+        {},
+        {
+            "Bucket": "bucket",
+            "Key": "key",
+            "UploadId": "upload",
+            "MultipartUpload": {
+                "Parts": [{"ETag": f'"{n}"', "PartNumber": n} for n in (1, 2, 3)]
+            },
+        },
+    )
+
+    manager.upload_object_pread(str(file_path), "bucket", "key")
+
+    stubber.assert_no_pending_responses()
+
+
+def test_upload_object_pread_aborts_when_a_part_fails(
+    manager: AWSCloudManager, stubber: Stubber, tmp_path: Path
+) -> None:
+    manager.multipart_threshold = 10
+    manager.multipart_chunksize = 7
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(bytes(14))
+    stubber.add_response("create_multipart_upload", {"UploadId": "upload"})
+    stubber.add_response("upload_part", {"ETag": '"1"'})
+    stubber.add_client_error("upload_part", "InternalError", "part failed")
+    stubber.add_response(
+        "abort_multipart_upload",
+        {},
+        {"Bucket": "bucket", "Key": "key", "UploadId": "upload"},
+    )
+
+    with pytest.raises(ClientError, match="InternalError"):
+        manager.upload_object_pread(str(file_path), "bucket", "key")
+
+    stubber.assert_no_pending_responses()
+
+
+def test_upload_object_pread_does_not_start_upload_for_unreadable_file(
+    manager: AWSCloudManager,
+    stubber: Stubber,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager.multipart_threshold = 10
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(bytes(14))
+
+    def deny(path: str, flags: int) -> int:
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, "open", deny)
+
+    with pytest.raises(PermissionError):
+        manager.upload_object_pread(str(file_path), "bucket", "key")
+
+    stubber.assert_no_pending_responses()